@@ -4,6 +4,8 @@ import os
 import sys
 from unittest.mock import MagicMock
 
+import pytest
+
 # Set fake environment variables to prevent initialization errors
 os.environ.setdefault("OPENAI_API_KEY", "fake-key-for-testing")
 os.environ.setdefault("RUNPOD_ENDPOINT_ID", "fake-endpoint-for-testing")
@@ -12,3 +14,11 @@ os.environ.setdefault("DISCORD_TOKEN", "fake-token-for-testing")
 
 # Mock logfire to avoid authentication issues during tests
 sys.modules["logfire"] = MagicMock()
+
+from src.models.schemas import MyDeps
+
+
+@pytest.fixture
+def default_deps():
+    """Fresh default MyDeps for tests that only need a placeholder."""
+    return MyDeps()
@@ -270,7 +270,7 @@ async def on_message(message: discord.Message):
 
                 # Update generated images if any were created
                 if deps.generated_images:
-                    generated_images = deps.generated_images
+                    generated_images = list(deps.generated_images)
             else:
                 # Normal string response
                 response_message = response_output
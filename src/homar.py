@@ -26,8 +26,8 @@ from src.models.schemas import MyDeps, UserType, GUEST_ALLOWED_TOOLS
 MAX_DELAY_SECONDS = 86400 * 7  # 7 days
 
 
-def _format_delay_seconds(seconds: int) -> str:
-    """Convert seconds to human-readable time format."""
+def _build_delay_string(seconds: int) -> str:
+    """Build the human-readable form of a delay given in seconds."""
     if seconds < 60:
         return f"{seconds} seconds"
     if seconds < 3600:
@@ -40,6 +40,26 @@ def _format_delay_seconds(seconds: int) -> str:
     return f"{hours} hours"
 
 
+# Precomputed strings for the most common delays: any seconds-only, whole-minute
+# or whole-hour delay up to the maximum.
+_DELAY_CACHE: dict[int, str] = {
+    seconds: _build_delay_string(seconds)
+    for seconds in (
+        *range(60),
+        *range(60, 3600, 60),
+        *range(3600, MAX_DELAY_SECONDS + 1, 3600),
+    )
+}
+
+
+def _format_delay_seconds(seconds: int) -> str:
+    """Convert seconds to human-readable time format."""
+    cached = _DELAY_CACHE.get(seconds)
+    if cached is not None:
+        return cached
+    return _build_delay_string(seconds)
+
+
 def _check_tool_access(ctx: RunContext[MyDeps], tool_name: str) -> str | None:
     """Return an error string if the user lacks access to *tool_name*, else None."""
     if (
@@ -565,7 +585,11 @@ async def run_homar_with_history(
     if deps is None:
         deps = MyDeps()
     agent_response = await homar.run(new_message, message_history=history, deps=deps)
-    return agent_response.output, agent_response.new_messages(), deps.generated_images
+    return (
+        agent_response.output,
+        agent_response.new_messages(),
+        list(deps.generated_images),
+    )
 
 
 def print_schema(messages: list[ModelMessage], info: AgentInfo) -> ModelResponse:
@@ -3,19 +3,18 @@
 import pytest
 from unittest.mock import Mock, patch
 from pydantic_ai import ModelRetry
-from src.homar import home_assistant_api
-from src.models.schemas import MyDeps
+from src.homar import homar, home_assistant_api
 
 
 class TestToolRetryBehavior:
     """Test that tools properly implement retry behavior."""
 
     @pytest.mark.asyncio
-    async def test_tool_raises_model_retry_on_error(self):
+    async def test_tool_raises_model_retry_on_error(self, default_deps):
         """Test that API tools raise ModelRetry when the agent fails."""
         # Create a mock context
         mock_ctx = Mock()
-        mock_ctx.deps = MyDeps()
+        mock_ctx.deps = default_deps
         mock_ctx.usage = Mock()
 
         # Mock the home_assistant_agent.run to raise an exception
@@ -32,11 +31,11 @@ class TestToolRetryBehavior:
             assert "try again" in str(exc_info.value)
 
     @pytest.mark.asyncio
-    async def test_tool_returns_success_on_valid_response(self):
+    async def test_tool_returns_success_on_valid_response(self, default_deps):
         """Test that API tools return successful response when agent succeeds."""
         # Create a mock context
         mock_ctx = Mock()
-        mock_ctx.deps = MyDeps()
+        mock_ctx.deps = default_deps
         mock_ctx.usage = Mock()
 
         # Mock the home_assistant_agent.run to return a successful response
@@ -53,8 +52,6 @@ class TestToolRetryConfiguration:
 
     def test_all_api_tools_exist(self):
         """Verify all API tools are registered with the agent."""
-        from src.homar import homar
-
         tool_names = list(homar._function_toolset.tools.keys())
 
         # Check that key API tools exist
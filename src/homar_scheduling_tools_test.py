@@ -88,6 +88,27 @@ async def cancel_scheduled_message_test_helper(message_id):
         return f"Could not find scheduled message with ID: {message_id}. Use list_scheduled_messages to see available IDs."
 
 
+async def _drain_scheduler():
+    """Cancel every pending message on the global scheduler and wait for cleanup."""
+    scheduler = get_scheduler()
+
+    # Cancel all existing messages and collect their tasks
+    tasks_to_wait = []
+    for message_id, delayed_msg in scheduler.get_scheduled_messages():
+        if delayed_msg.task and not delayed_msg.task.done():
+            tasks_to_wait.append(delayed_msg.task)
+        scheduler.cancel_message(message_id)
+
+    # Wait for all cancelled tasks to complete
+    for task in tasks_to_wait:
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        except Exception:
+            pass
+
+
 class TestSchedulingTools:
     """Test the scheduling tools in homar."""
 
@@ -109,58 +130,10 @@ class TestSchedulingTools:
 
     @pytest_asyncio.fixture(autouse=True)
     async def clear_scheduler(self):
-        """Clear all scheduled messages before each test."""
-        scheduler = get_scheduler()
-
-        # Cancel all existing messages and collect their tasks (BEFORE test)
-        tasks_to_wait = []
-        messages_before = list(scheduler.get_scheduled_messages())
-        for message_id, delayed_msg in messages_before:
-            if delayed_msg.task and not delayed_msg.task.done():
-                tasks_to_wait.append(delayed_msg.task)
-            scheduler.cancel_message(message_id)
-
-        # Wait for all cancelled tasks to complete
-        for task in tasks_to_wait:
-            try:
-                await task
-            except asyncio.CancelledError:
-                pass
-            except Exception:
-                pass
-
-        # Extra wait to ensure cleanup completes
-        await asyncio.sleep(0.2)
-
-        # Verify cleanup succeeded
-        remaining = scheduler.get_scheduled_messages()
-        if remaining:
-            # Force cleanup if still messages present
-            for message_id, _ in remaining:
-                scheduler.cancel_message(message_id)
-            await asyncio.sleep(0.1)
-
+        """Clear all scheduled messages before and after each test."""
+        await _drain_scheduler()
         yield
-
-        # Clean up after test
-        tasks_to_wait = []
-        messages_after = list(scheduler.get_scheduled_messages())
-        for message_id, delayed_msg in messages_after:
-            if delayed_msg.task and not delayed_msg.task.done():
-                tasks_to_wait.append(delayed_msg.task)
-            scheduler.cancel_message(message_id)
-
-        # Wait for all cancelled tasks to complete
-        for task in tasks_to_wait:
-            try:
-                await task
-            except asyncio.CancelledError:
-                pass
-            except Exception:
-                pass
-
-        # Extra wait to ensure cleanup completes
-        await asyncio.sleep(0.2)
+        await _drain_scheduler()
 
     @pytest.mark.asyncio
     async def test_list_scheduled_messages_empty(self):
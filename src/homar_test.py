@@ -3,7 +3,12 @@
 import pytest
 from datetime import datetime, timedelta
 from unittest.mock import MagicMock
-from src.homar import _format_delay_seconds, _check_tool_access
+from src.homar import (
+    MAX_DELAY_SECONDS,
+    _DELAY_CACHE,
+    _format_delay_seconds,
+    _check_tool_access,
+)
 from src.models.schemas import MyDeps, UserType
 
 
@@ -38,6 +43,13 @@ class TestFormatDelaySeconds:
         assert _format_delay_seconds(5400) == "1 hours and 30 minutes"
         assert _format_delay_seconds(9000) == "2 hours and 30 minutes"
 
+    def test_precomputed_delays_coverage(self):
+        """Test that the lookup table covers whole seconds, minutes and hours only."""
+        for seconds in (59, 3540, 3600, MAX_DELAY_SECONDS):
+            assert seconds in _DELAY_CACHE
+        assert 90 not in _DELAY_CACHE
+        assert _format_delay_seconds(90) == "1 minutes"
+
 
 class TestDatetimeParsing:
     """Test datetime parsing logic for scheduled messages."""
@@ -1,12 +1,12 @@
 """Pydantic models for Homarv3 API."""
 
-from dataclasses import dataclass
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import StrEnum, auto
 from typing import Any
 
-from pydantic import BaseModel, Field
-from pydantic_ai import ModelMessage
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Role(StrEnum):
@@ -25,7 +25,10 @@ class UserType(StrEnum):
 
 
 # Tools accessible to Guest users (restricted accounts)
-GUEST_ALLOWED_TOOLS: set[str] = {"home_assistant_api"}
+GUEST_ALLOWED_TOOLS: frozenset[str] = frozenset({"home_assistant_api"})
+
+# Maximum number of generated image paths kept on MyDeps for a single run
+MAX_GENERATED_IMAGES = 256
 
 # Discord role name → UserType mapping (case-insensitive).
 # The first match in priority order (ADMIN > DEFAULT > GUEST) wins.
@@ -41,17 +44,21 @@ def get_user_type_from_discord_roles(role_names: list[str]) -> UserType:
     Roles are matched case-insensitively against the known role names.
     ADMIN takes priority over GUEST; members with no matching role get DEFAULT.
     """
-    lower_roles = {name.lower() for name in role_names}
-    if "admin" in lower_roles:
-        return UserType.ADMIN
-    if "guest" in lower_roles:
-        return UserType.GUEST
-    return UserType.DEFAULT
+    user_type = UserType.DEFAULT
+    for name in role_names:
+        matched = _DISCORD_ROLE_MAP.get(name.lower())
+        if matched is UserType.ADMIN:
+            return matched
+        if matched is not None:
+            user_type = matched
+    return user_type
 
 
 class InteractRequest(BaseModel):
     """Request model for interact endpoint."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     message: str = Field(..., description="Message to process")
     user_id: str | None = Field(None, description="Optional user identifier")
 
@@ -59,24 +66,22 @@ class InteractRequest(BaseModel):
 class HealthResponse(BaseModel):
     """Response model for health endpoint."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     status: str = Field(..., description="Service status")
     timestamp: datetime = Field(..., description="Current timestamp")
     version: str = Field(..., description="Application version")
 
 
-@dataclass
+@dataclass(slots=True)
 class MyDeps:
     """Dependencies for agents."""
 
     mode: str = "standard"
     thread_id: int | None = None
     send_message_callback: Any | None = None
-    generated_images: list[str] | None = (
-        None  # List of image file paths generated during run
-    )
+    generated_images: deque[str] = field(
+        default_factory=lambda: deque(maxlen=MAX_GENERATED_IMAGES)
+    )  # Image file paths generated during run, oldest dropped first
     username: str | None = None
     user_type: UserType = UserType.DEFAULT
-
-    def __post_init__(self):
-        if self.generated_images is None:
-            self.generated_images = []
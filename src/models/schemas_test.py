@@ -1,12 +1,22 @@
 """Unit tests for src/models/schemas.py."""
 
+from datetime import datetime
+
+import pytest
+from pydantic import ValidationError
+
 from src.models.schemas import (
+    HealthResponse,
+    InteractRequest,
+    MAX_GENERATED_IMAGES,
     UserType,
     GUEST_ALLOWED_TOOLS,
     get_user_type_from_discord_roles,
     MyDeps,
 )
 
+_NOW = datetime(2024, 1, 1, 12, 0, 0)
+
 
 class TestUserType:
     """Test the UserType enum values."""
@@ -33,42 +43,72 @@ class TestGuestAllowedTools:
         ):
             assert tool not in GUEST_ALLOWED_TOOLS
 
+    def test_allowed_tools_are_immutable(self):
+        assert isinstance(GUEST_ALLOWED_TOOLS, frozenset)
+
 
 class TestGetUserTypeFromDiscordRoles:
     """Test the get_user_type_from_discord_roles helper."""
 
-    def test_no_roles_defaults_to_default(self):
-        assert get_user_type_from_discord_roles([]) == UserType.DEFAULT
-
-    def test_unrelated_roles_default_to_default(self):
-        assert (
-            get_user_type_from_discord_roles(["member", "booster"]) == UserType.DEFAULT
-        )
-
-    def test_admin_role_returns_admin(self):
-        assert get_user_type_from_discord_roles(["admin"]) == UserType.ADMIN
-
-    def test_admin_role_case_insensitive(self):
-        assert get_user_type_from_discord_roles(["Admin"]) == UserType.ADMIN
-        assert get_user_type_from_discord_roles(["ADMIN"]) == UserType.ADMIN
-
-    def test_guest_role_returns_guest(self):
-        assert get_user_type_from_discord_roles(["guest"]) == UserType.GUEST
-
-    def test_guest_role_case_insensitive(self):
-        assert get_user_type_from_discord_roles(["Guest"]) == UserType.GUEST
-
-    def test_admin_takes_priority_over_guest(self):
-        assert get_user_type_from_discord_roles(["guest", "admin"]) == UserType.ADMIN
-
-    def test_admin_with_other_roles(self):
-        assert (
-            get_user_type_from_discord_roles(["member", "Admin", "booster"])
-            == UserType.ADMIN
-        )
-
-    def test_guest_with_other_roles(self):
-        assert get_user_type_from_discord_roles(["member", "Guest"]) == UserType.GUEST
+    @pytest.mark.parametrize(
+        "roles, expected",
+        [
+            ([], UserType.DEFAULT),
+            (["member", "booster"], UserType.DEFAULT),
+            (["admin"], UserType.ADMIN),
+            (["Admin"], UserType.ADMIN),
+            (["ADMIN"], UserType.ADMIN),
+            (["guest"], UserType.GUEST),
+            (["Guest"], UserType.GUEST),
+            (["guest", "admin"], UserType.ADMIN),
+            (["member", "Admin", "booster"], UserType.ADMIN),
+            (["member", "Guest"], UserType.GUEST),
+        ],
+    )
+    def test_user_type_from_roles(self, roles, expected):
+        assert get_user_type_from_discord_roles(roles) == expected
+
+
+class TestInteractRequest:
+    """Test the InteractRequest model."""
+
+    def test_interact_request_creation(self):
+        request = InteractRequest(message="Hello")
+        assert request.message == "Hello"
+        assert request.user_id is None
+
+    def test_interact_request_validation(self):
+        with pytest.raises(ValidationError) as exc_info:
+            InteractRequest.model_validate({})
+        assert exc_info.value.error_count() == 1
+        assert exc_info.value.errors()[0]["loc"] == ("message",)
+
+    def test_interact_request_rejects_extra_fields(self):
+        with pytest.raises(ValidationError):
+            InteractRequest(message="Hello", channel="general")
+
+    def test_interact_request_is_frozen(self):
+        request = InteractRequest(message="Hello")
+        with pytest.raises(ValidationError):
+            request.message = "Changed"
+
+
+class TestHealthResponse:
+    """Test the HealthResponse model."""
+
+    def test_health_response_creation(self):
+        response = HealthResponse(status="healthy", timestamp=_NOW, version="0.1.0")
+        assert response.status == "healthy"
+        assert response.timestamp is _NOW
+        assert response.version == "0.1.0"
+
+    def test_health_response_validation(self):
+        with pytest.raises(ValidationError) as exc_info:
+            HealthResponse.model_validate({"status": "healthy"})
+        assert {error["loc"] for error in exc_info.value.errors()} == {
+            ("timestamp",),
+            ("version",),
+        }
 
 
 class TestMyDeps:
@@ -87,3 +127,15 @@ class TestMyDeps:
     def test_guest_user_type(self):
         deps = MyDeps(username="guest_user", user_type=UserType.GUEST)
         assert deps.user_type == UserType.GUEST
+
+    def test_generated_images_not_shared(self):
+        first, second = MyDeps(), MyDeps()
+        first.generated_images.append("image.png")
+        assert list(second.generated_images) == []
+
+    def test_generated_images_are_bounded(self):
+        deps = MyDeps()
+        for i in range(MAX_GENERATED_IMAGES + 1):
+            deps.generated_images.append(f"image_{i}.png")
+        assert len(deps.generated_images) == MAX_GENERATED_IMAGES
+        assert deps.generated_images[0] == "image_1.png"